@@ -2,14 +2,22 @@
 # -*- coding: utf-8 -*-
 
 import os, sys, json, subprocess, platform, hashlib, shutil, struct, ctypes
-import urllib.request, urllib.parse, time, re
+import urllib.request, urllib.parse, time, re, threading
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, Future
+from collections import OrderedDict
 from typing import Any, Optional, Dict, List, Tuple
 
+try:
+    import orjson  # 選用：大型 covers_map/titles_map 解析較快
+except ImportError:
+    orjson = None
+
 from PySide6.QtCore import (Qt, QSize, QRect, QPoint, QSortFilterProxyModel,
-                            QAbstractListModel, QModelIndex, Signal, QObject, QEvent, QRegularExpression, QThread)
+                            QAbstractListModel, QModelIndex, Signal, QObject, QEvent, QRegularExpression, QThread, QTimer)
 from PySide6.QtGui import (QGuiApplication, QIcon, QPixmap, QPainter, 
-                           QFont, QAction, QActionGroup, QCursor, QFontMetrics, QColor, QPalette, QImage)
+                           QFont, QAction, QActionGroup, QCursor, QFontMetrics, QColor, QPalette, QImage, QImageReader,
+                           QPixmapCache)
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QListView, QFileDialog, QMessageBox,
     QLabel, QPushButton, QLineEdit, QToolBar, QStyle, QStatusBar, QHBoxLayout,
@@ -21,8 +29,13 @@ APP_TITLE = "melonDS Launcher v2.1.2"
 CONFIG_FILE = "config/melonds_launcher_config.json"
 COVERS_MAP_FILE = "config/covers_map.json"
 TITLES_MAP_FILE = "config/titles_map.json"
+NDS_INFO_CACHE_FILE = "config/nds_info_cache.json"
+
+# 右欄放大圖的最大尺寸（grid 160x140 * 2 倍 * 縮放上限 220%）
+COVER_BASE_MAX = (int(160 * 2.2 * 2), int(140 * 2.2 * 2))
 
 SUPPORTED_EXTS = [".nds", ".NDS"]
+ROM_EXT_TUPLE = tuple(sorted({e.lower() for e in SUPPORTED_EXTS}))  # 給 name.lower().endswith() 一次比對
 IMG_EXTS = [".png", ".jpg", ".jpeg"]
 
 DEFAULT_CONFIG = {
@@ -42,6 +55,11 @@ DEFAULT_CONFIG = {
     "auto_download_covers": True,
     "cover_sources": ["libretro", "gametdb"],
     "cover_timeout_sec": 10,
+    "scaled_cache_dir": "covers/.thumb_cache",
+    "scaled_cache_max": 2000,
+    "scaled_cache_mb": 500,
+    "thumb_prefetch": 120,
+    "pixmap_cache_mb": 128,
 
 }
 
@@ -111,13 +129,21 @@ I18N = {
     },
 }
 
+_TR_ZH = I18N["zh"]
+_TR_EN = I18N["en"]
+
 def tr(app, key):
-    lang = getattr(app, "lang", "zh")
-    return I18N.get(lang, I18N["zh"]).get(key, key)
+    table = _TR_EN if getattr(app, "lang", "zh") == "en" else _TR_ZH
+    try:
+        return table[key]
+    except KeyError:
+        return key
 
 def load_json(path: Path, default):
     if path.exists():
         try:
+            if orjson is not None:
+                return orjson.loads(path.read_bytes())
             return json.loads(path.read_text(encoding="utf-8"))
         except Exception:
             return default
@@ -125,34 +151,113 @@ def load_json(path: Path, default):
 
 def save_json(path: Path, data):
     try:
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+        if orjson is not None:
+            raw = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        else:
+            raw = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+        # 先寫暫存檔再替換，避免中途失敗留下損毀的 JSON
+        tmp = path.with_name(path.name + ".tmp")
+        try:
+            tmp.write_bytes(raw)
+        except FileNotFoundError:
+            # 資料夾不存在時才建立，平常不必每次寫入都多一次 mkdir
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_bytes(raw)
+        os.replace(tmp, path)
     except Exception as e:
         QMessageBox.critical(None, "儲存失敗", f"{path}\n{e}")
 
-def read_nds_info(path: Path):
-    title, code = "", ""
+def save_image_atomic(img: QImage, path: Path, fmt: str, quality: int = -1) -> bool:
+    """先存到本執行緒專用的暫存檔再 os.replace，其他執行緒不會讀到寫到一半的圖檔。"""
+    tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+    if not img.save(str(tmp), fmt, quality):
+        # 資料夾被刪除時才補建
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if not img.save(str(tmp), fmt, quality):
+            return False
     try:
-        with open(path, "rb") as f:
-            head = f.read(0x200)
-        title = head[0:12].decode("ascii", "ignore").strip("\x00 ").strip()
-        code = head[0x0C:0x10].decode("ascii", "ignore").strip("\x00 ").strip()
-    except Exception:
-        pass
+        os.replace(tmp, path)
+    except OSError:
+        # Windows 上目標檔正被讀取時無法替換；另一個執行緒已寫好同一張圖，直接沿用
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        return path.exists()
+    return True
+
+def read_nds_head(path: Path) -> bytes:
+    """讀取 .nds 檔頭 0x200 bytes；失敗回傳空 bytes。直接用 os.read，不建立 BufferedReader。"""
+    try:
+        fd = os.open(str(path), os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    except OSError:
+        return b""
+    try:
+        head = os.read(fd, 0x200)
+        # 只讀一次檔頭，提示核心不必保留這段快取（Windows 無此 API）
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        except (AttributeError, OSError):
+            pass
+        return head
+    except OSError:
+        return b""
+    finally:
+        os.close(fd)
+
+# 0x00: 遊戲標題（12 bytes）、0x0C: GameCode（4 bytes）
+_NDS_TITLE_CODE = struct.Struct("<12s4s")
+
+def parse_nds_head(head: bytes):
+    if len(head) < _NDS_TITLE_CODE.size:
+        return "", ""
+    title_b, code_b = _NDS_TITLE_CODE.unpack_from(head, 0)
+    title = title_b.strip(b"\x00 ").decode("ascii", "ignore").strip()
+    code = code_b.strip(b"\x00 ").decode("ascii", "ignore").strip()
     return title, code
 
-def game_id_for(path: Path):
-    _, code = read_nds_info(path)
+def game_id_for(path: Path, head: Optional[bytes] = None):
+    if head is None:
+        head = read_nds_head(path)
+    _, code = parse_nds_head(head)
     if code and len(code) == 4:
         return f"NDS-{code}"
+    # 無 GameCode：沿用前 1 MiB 的 MD5，titles_map/covers_map 既有的鍵才不會失效。
+    # 結果隨檔頭快取（mtime, size）保存，每個 ROM 只需讀一次；
+    # 以同一個 64 KiB 緩衝區分段讀取，不另配置 1 MiB 的 bytes
     try:
         h = hashlib.md5()
+        buf = bytearray(65536)
+        mv = memoryview(buf)
+        remaining = 1024*1024
         with open(path, "rb") as f:
-            h.update(f.read(1024*1024))
+            while remaining > 0:
+                n = f.readinto(mv[:min(remaining, len(buf))])
+                if not n:
+                    break
+                h.update(mv[:n])
+                remaining -= n
         return f"HASH-{h.hexdigest()}"
     except Exception:
         return path.stem.lower()
 
+class LRUCache(OrderedDict):
+    """容量有限的 dict：讀取時移到最新，寫入超過上限時丟掉最舊的項目。"""
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        while len(self) > self.maxsize:
+            self.popitem(last=False)
+
 # ----------- Model 層（以顯示 Title 排序/搜尋） ----------- #
 class Roles:
     Title = Qt.UserRole + 1
@@ -162,11 +267,27 @@ class Roles:
     GameCode = Qt.UserRole + 5
 
 class GameItem:
-    def __init__(self, path: Path, title: str, cover: Optional[Path], pinned: bool):
+    # 固定欄位：數千筆時省下每筆的 __dict__，屬性存取也較快
+    __slots__ = ("path", "spath", "gid", "title", "search_cf", "cover", "scover", "pinned")
+
+    def __init__(self, path: Path, title: str, cover: Optional[Path], pinned: bool, gid: str = ""):
         self.path = path
+        # 重新整理時先算好，避免 data()/paint 每次呼叫都轉字串或讀檔
+        self.spath = str(path).replace("\\", "/")
+        self.gid = gid
+        self.set_title(title)
+        self.set_cover(cover)
+        self.pinned = pinned
+
+    def set_title(self, title: str):
         self.title = title
+        # 搜尋用（不分大小寫）：標題與路徑合成一個字串，每列只做一次 in；
+        # 以換行分隔，單行輸入框的關鍵字不會跨兩段誤中
+        self.search_cf = f"{title}\n{self.spath}".casefold()
+
+    def set_cover(self, cover: Optional[Path]):
         self.cover = cover
-        self.pinned = pinned
+        self.scover = str(cover) if cover else ""
 
 class GameListModel(QAbstractListModel):
     def __init__(self, items: List[GameItem]):
@@ -183,18 +304,33 @@ class GameListModel(QAbstractListModel):
         if role in (Qt.DisplayRole, Roles.Title):
             return g.title
         if role == Roles.Path:
-            return str(g.path).replace("\\", "/")
+            return g.spath
         if role == Roles.Cover:
-            return str(g.cover) if g.cover else ""
+            return g.scover
         if role == Roles.Pinned:
             return g.pinned
         if role == Roles.GameCode:
-            return game_id_for(g.path)
+            return g.gid
         return None
 
     def item(self, row: int) -> GameItem:
         return self._items[row]
 
+    def setItems(self, items: List[GameItem]):
+        """替換整份清單。路徑順序相同時只對內容有變的列發 dataChanged，保留選取與捲動位置。"""
+        old = self._items
+        if len(old) != len(items) or any(a.path != b.path for a, b in zip(old, items)):
+            self.beginResetModel()
+            self._items = items
+            self.endResetModel()
+            return
+        changed = [row for row, (a, b) in enumerate(zip(old, items))
+                   if (a.title, a.cover, a.pinned, a.gid) != (b.title, b.cover, b.pinned, b.gid)]
+        self._items = items
+        # 多列變動時合併成一次 dataChanged(首列, 末列)，view/proxy 只處理一次
+        if changed:
+            self.dataChanged.emit(self.index(changed[0], 0), self.index(changed[-1], 0))
+
     def setPinned(self, row: int, val: bool):
         g = self._items[row]
         g.pinned = val
@@ -203,7 +339,7 @@ class GameListModel(QAbstractListModel):
 
     def setTitle(self, row: int, title: str):
         g = self._items[row]
-        g.title = title
+        g.set_title(title)
         idx = self.index(row, 0)
         self.dataChanged.emit(idx, idx, [Qt.DisplayRole, Roles.Title])
 
@@ -212,23 +348,24 @@ class CoverFetcher(QObject):
     found = Signal(str, str)   # (gid, cover_path)
     finished = Signal()
 
-    def __init__(self, app, rom_paths):
+    def __init__(self, app, jobs):
         super().__init__()
         self.app = app
-        self.rom_paths = rom_paths
+        # [(ROM 路徑, gid, 顯示名稱, GameCode)]：由 GUI 執行緒先查好，
+        # 背景執行緒不碰檔頭/標題/封面等快取 dict
+        self.jobs = jobs
         self._stop = False
 
     def stop(self):
         self._stop = True
 
     def run(self):
-        for rp in self.rom_paths:
+        for rp, gid, title, code in self.jobs:
             if self._stop:
                 break
             try:
-                saved = self.app._try_download_cover_for(rp)
+                saved = self.app._try_download_cover_for(rp, title, code)
                 if saved and Path(saved).exists():
-                    gid = game_id_for(rp)
                     self.found.emit(gid, str(saved))
             except Exception:
                 pass
@@ -254,6 +391,81 @@ def _http_get_to_file(url: str, out_path: Path, timeout_sec: int = 7) -> bool:
     except Exception:
         return False
 
+# RGB555 的 5-bit 色階 -> 8-bit（查表取代逐通道乘除）
+_SCALE5TO8 = bytes(i * 255 // 31 for i in range(32))
+# 輸出逐列：第 ty 排 tiles 的第 py 列 = 4 個 tile 各自的第 py 列（每列 4 bytes）；位移固定，只算一次
+_NDS_ICON_ROW_OFFSETS = tuple((ty * 4 + tx) * 32 + py * 4
+                              for ty in range(4) for py in range(8) for tx in range(4))
+
+def decode_nds_icon(tile_bytes: bytes, pal_bytes: bytes) -> QImage:
+    """NDS banner icon：32x32、4bpp（4x4 個 8x8 tiles）、16 色 RGB555 調色盤，index 0 透明。
+    先把 256 種 byte 值各對應到兩個 RGBA 像素，再依 tile 順序整批串接，不逐像素 setPixel。"""
+    c = _SCALE5TO8
+    pal = [bytes((c[v & 0x1F], c[(v >> 5) & 0x1F], c[(v >> 10) & 0x1F], 255))
+           for v in struct.unpack("<16H", pal_bytes)]
+    pal[0] = pal[0][:3] + b"\x00"   # index 0 視為透明
+    # 每個 byte 含兩個像素：低 4 bits 在左、高 4 bits 在右
+    pair = [pal[v & 0x0F] + pal[v >> 4] for v in range(256)]
+    # 先把 tile 順序重排成逐列的 512 bytes，再以 map 在 C 層查表串接，迴圈內不做索引運算
+    linear = b"".join(tile_bytes[o:o + 4] for o in _NDS_ICON_ROW_OFFSETS)
+    buf = b"".join(map(pair.__getitem__, linear))
+    return QImage(buf, 32, 32, 32 * 4, QImage.Format_RGBA8888).copy()
+
+def read_image_scaled(path: str, w: int, h: int) -> QImage:
+    """讀取圖片；JPEG 且遠大於 w×h 時讓 libjpeg 直接以縮小的 IDCT 解碼（約目標 2 倍大小），
+    不必先解出全解析度。回傳的圖仍需呼叫端再平滑縮到最終尺寸。"""
+    reader = QImageReader(path)
+    if bytes(reader.format()).lower() in (b"jpeg", b"jpg"):
+        full = reader.size()
+        if full.isValid() and (full.width() > w * 2 or full.height() > h * 2):
+            reader.setScaledSize(full.scaled(w * 2, h * 2, Qt.KeepAspectRatio))
+    return reader.read()
+
+def render_cover_image(src, w: int, h: int, pin_src: str = "") -> QImage:
+    """載入（src 為路徑或 QImage）並等比縮放封面，必要時於右下角疊上 pin 圖示。只使用 QImage，可在非 GUI 執行緒呼叫。"""
+    img = src if isinstance(src, QImage) else read_image_scaled(src, w, h)
+    if img.isNull():
+        return img
+    img = img.scaled(w, h, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    if pin_src:
+        pin_size = max(12, int(min(img.width(), img.height()) * 0.26))
+        pin_img = _scaled_pin_image(pin_src, pin_size)
+        if pin_img is not None:
+            # 直接畫在縮好的封面上，不另建一張透明底圖再整張複製
+            img = img.convertToFormat(QImage.Format_ARGB32_Premultiplied)
+            painter = QPainter(img)
+            painter.setRenderHint(QPainter.SmoothPixmapTransform, True)
+            margin = max(2, int(pin_size * 0.08))
+            x = img.width() - pin_img.width() - margin
+            y = img.height() - pin_img.height() - margin
+            painter.drawImage(x, y, pin_img)
+            painter.end()
+    return img
+
+# pin 圖示依尺寸快取（背景執行緒也會用到，需加鎖）；縮放倍率有限，筆數很少
+_pin_images: Dict[Tuple[str, int], QImage] = {}
+_pin_images_lock = threading.Lock()
+
+def _scaled_pin_image(pin_src: str, size: int) -> Optional[QImage]:
+    key = (pin_src, size)
+    with _pin_images_lock:
+        img = _pin_images.get(key)
+    if img is None:
+        img = QImage(pin_src)
+        if img.isNull():
+            return None
+        img = img.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        with _pin_images_lock:
+            _pin_images[key] = img
+    return img
+
+class ThumbSignals(QObject):
+    ready = Signal(object, object, int)    # (key, QImage | None, 寫入磁碟快取的位元組數；未寫入為 0)
+    pruned = Signal(int, object)           # 磁碟快取清理後剩餘的 (檔數, 位元組數)
+
+class ScanSignals(QObject):
+    done = Signal(object)   # [(ROM 路徑, 檔頭快取項目 | None), ...]
+
 # ----------- 主視窗 ----------- #
 class LauncherApp(QMainWindow):
     def __init__(self):
@@ -262,40 +474,126 @@ class LauncherApp(QMainWindow):
         self.resize(1280, 820)
 
         self.config_path = Path(CONFIG_FILE)
-        self.config_dir = Path("config"); self.config_dir.mkdir(exist_ok=True)
+        self.config_dir = Path("config")
+        if not self.config_dir.is_dir():
+            self.config_dir.mkdir(exist_ok=True)
         self.config = load_json(self.config_path, DEFAULT_CONFIG.copy())
         self.lang = self.config.get("lang", "zh")
+        # 目前語言的字串表；熱路徑直接查 self._tr[key]，其餘仍用 tr()
+        self._tr: Dict[str, str] = _TR_EN if self.lang == "en" else _TR_ZH
+        # 目前縮放倍率；繪製/縮圖等熱路徑直接讀這個屬性，只在 _apply_zoom 更新
+        self._ui_scale: float = float(self.config.get("ui_scale", 1.0))
 
-        # sanitize pinned list
+        # sanitize pinned list（已排序且無重複時不必寫回）
         try:
-            files = set(self.config.get("pinned_files") or [])
-            self.config["pinned_files"] = sorted(files)
-            save_json(self.config_path, self.config)
+            old = self.config.get("pinned_files") or []
+            files = sorted(set(old))
+            self.config["pinned_files"] = files
+            if files != old:
+                save_json(self.config_path, self.config)
         except Exception:
             pass
 
-        self.covers_path = Path(self.config.get("covers_dir", "covers")); self.covers_path.mkdir(parents=True, exist_ok=True)
+        self.covers_path = Path(self.config.get("covers_dir", "covers"))
+        if not self.covers_path.is_dir():
+            self.covers_path.mkdir(parents=True, exist_ok=True)
         self.map_path = Path(COVERS_MAP_FILE); self.covers_map = load_json(self.map_path, {})
         self.titles_path = Path(TITLES_MAP_FILE); self.titles_map = load_json(self.titles_path, {})
+        self._titles_dirty = False   # 新 ROM 的預設標題先累積，refresh 結束時一次寫回
+        # ROM 標頭快取：path -> (mtime_ns, size, title, code, gid)，關閉時寫回
+        self.nds_info_path = Path(NDS_INFO_CACHE_FILE)
+        self._nds_info_cache: Dict[str, Tuple[int,int,str,str,str]] = load_json(self.nds_info_path, {})
+        self._nds_info_dirty = False
         # 縮圖輸出資料夾（可在設定檔調整）
         self.thumb_path = Path(self.config.get("thumb_dir", "covers/.thumb"))
-        self.thumb_path.mkdir(parents=True, exist_ok=True)
-
+        if not self.thumb_path.is_dir():
+            self.thumb_path.mkdir(parents=True, exist_ok=True)
+        # 顯示尺寸縮圖（含 pin 疊圖）的磁碟快取，跨次啟動沿用
+        self.scaled_cache_path = Path(self.config.get("scaled_cache_dir", "covers/.thumb_cache"))
+        if not self.scaled_cache_path.is_dir():
+            self.scaled_cache_path.mkdir(parents=True, exist_ok=True)
+        # 快取檔數與總位元組數；啟動時在背景掃描/清理後由 _on_scaled_cache_pruned 填入實際值
+        self._scaled_cache_count = 0
+        self._scaled_cache_bytes = 0
+        self._prune_future: Optional[Future] = None
 
         self._icons: Dict[str, QIcon] = {}
-        self._thumb_cache: Dict[Tuple[str,int,int], QPixmap] = {}
-        self._nds_icon_cache: Dict[Tuple[str,int], QPixmap] = {}
+        self._pin_src: Optional[str] = None
+        self._covers_index: Optional[Dict[str, Path]] = None
+        # 顯示名稱（每次 refresh 清空）與釘選檔名集合
+        self._dn_cache: Dict[str, str] = {}
+        self._pin_set = set(self.config.get("pinned_files") or [])
+        # 上次 ROM 目錄掃描結果：(rom_dir, {資料夾: mtime_ns}, ROM 清單)
+        self._scan_cache: Optional[Tuple[str, Dict[str, int], List[Path]]] = None
+        # 本次 refresh 內已取得的 ROM stat（掃描時順手記下），refresh 前後清空
+        self._rom_stats: Dict[str, os.stat_result] = {}
+        # 上次完整掃描的 ROM 清單與各自的 gid；釘選/改名只改中繼資料，直接沿用不重掃
+        self._last_scan: Optional[List[Path]] = None
+        self._last_gids: Dict[Path, str] = {}
+        # ROM 路徑 -> 已驗證存在的封面（或 None）；refresh / 封面變更時清空
+        self._covers_valid: Dict[str, Optional[Path]] = {}
+        # covers_map 中檔案確實存在的項目（gid -> Path）；第一次用到時檢查一輪，
+        # 之後只隨封面變更更新，明確的重新整理（reload_rom_list）時重建
+        self._covers_resolved: Optional[Dict[str, Path]] = None
+        # 縮圖與 NDS 圖示都放 QPixmapCache（Qt 內建 LRU，以 KiB 計算總量）
+        QPixmapCache.setCacheLimit(int(self.config.get("pixmap_cache_mb", 128)) * 1024)
+        self._nds_icon_missing: set = set()   # 沒有 banner icon 的 ROM（鍵同 32x32 快取）
+        # 封面解碼/縮放交給背景執行緒，完成後經 signal 回到 GUI 執行緒轉成 QPixmap
+        self._cover_executor = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4))
+        self._thumb_pending: Dict[Tuple[str,int,int,bool,bool], Future] = {}
+        self._thumb_failed: set = set()   # 解碼失敗/封面不存在的 key；refresh 時清空
+        # 封面檔被替換（同路徑重新選擇/下載）的次數；併入 QPixmapCache 鍵，舊圖自然失效
+        self._cover_rev: Dict[str, int] = {}
+        self._thumb_signals = ThumbSignals()
+        self._thumb_signals.ready.connect(self._on_thumb_ready)
+        self._thumb_signals.pruned.connect(self._on_scaled_cache_pruned)
+        self._schedule_prune_scaled_cache()
+        # 冷啟動的 ROM 檔頭讀取也在背景進行，讀完才建立清單；
+        # 另用一個小 pool 分段平行讀取，不佔用縮圖工作的 worker
+        self._header_workers = min(4, os.cpu_count() or 2)
+        self._header_executor = ThreadPoolExecutor(max_workers=self._header_workers)
+        self._scan_pending = 0   # 尚未回報的檔頭讀取分段數
+        self._nds_info_attempted: set = set()   # 已送進背景讀取的 ROM 路徑
+        self._scan_signals = ScanSignals()
+        self._scan_signals.done.connect(self._on_nds_info_ready)
+        self._cover_base_cache: Dict[str, QImage] = LRUCache(32)
+        self._cover_base_lock = threading.Lock()
         self._view_mode = self.config.get("view_mode", "grid")
-        # 右欄寬度基準：只在啟動時掃描一次（不隨後續 refresh 改變）
-        self._panel_base_s: float = float(self.config.get("ui_scale", 1.0))
+        self._applied_view: Optional[Tuple[str, float]] = None
+        # 右欄寬度基準：只在啟動時估算一次（不隨後續 refresh 改變）
+        self._panel_base_s: float = self._ui_scale
         self._panel_base_cover_w: int | None = None
+        self._panel_w_scale: Optional[float] = None   # 目前右欄寬度對應的 ui_scale
+        self._details_sig: Optional[tuple] = None       # 右欄目前顯示內容的識別
+        self._right_cover_pm: Optional[QPixmap] = None
         self._only_pinned = bool(self.config.get("only_pinned", False))
 
+        # 設定檔延遲寫入：縮放拖曳等連續操作只寫一次
+        self._cfg_save_timer = QTimer(self)
+        self._cfg_save_timer.setSingleShot(True)
+        self._cfg_save_timer.setInterval(250)
+        self._cfg_save_timer.timeout.connect(lambda: save_json(self.config_path, self.config))
+
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(120)
+        self._search_timer.timeout.connect(lambda: self.proxy.setFilterString(self.ed_search.text()))
+
+        self._zoom_timer = QTimer(self)
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.setInterval(80)
+        self._zoom_timer.timeout.connect(self._apply_zoom)
+
         # 拖曳捲動狀態（反向拖曳）
         self._drag_scroll_active = False
         self._drag_last_pos = None
         self._drag_ctx = None
 
+        # 右欄字體的基準只建一次；縮放時複製後改字級即可
+        self._f_right_title = QFont(self.font())
+        self._f_right_title.setBold(True)
+        self._f_right_plain = QFont(self.font())
+
         self._build_ui()
         self._set_app_icon()
         self._compute_panel_base_width_once()
@@ -323,12 +621,22 @@ class LauncherApp(QMainWindow):
             ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID("melonDS.Launcher")
 
     def _load_icon(self, name: str):
+        if name in self._icons:
+            return self._icons[name]
         p = self._resolve_asset_path(f"assets/{name}.png")
         if not p.exists():
             return None
-        icon = QIcon(QPixmap(str(p)))
+        icon = QIcon(str(p))   # 由 QIcon 依實際繪製尺寸載入，不先建一張原尺寸 QPixmap
+        self._icons[name] = icon
         return icon
 
+    def _pin_asset(self) -> str:
+        """pin.png 路徑只解析一次（_resolve_asset_path 會逐一 stat 候選資料夾）。"""
+        if self._pin_src is None:
+            pin_path = self._resolve_asset_path("assets/pin.png")
+            self._pin_src = str(pin_path) if pin_path.exists() else ""
+        return self._pin_src
+
     # ---------- 介面 ---------- #
     def _build_ui(self):
         # Toolbar
@@ -420,7 +728,7 @@ class LauncherApp(QMainWindow):
         tb.addWidget(self.lbl_zoom)
         self.slider = QSlider(Qt.Horizontal)
         self.slider.setRange(60, 220)
-        self.slider.setValue(int(float(self.config.get("ui_scale", 1.0)) * 100))
+        self.slider.setValue(int(self._ui_scale * 100))
         self.slider.valueChanged.connect(self._on_zoom_changed)
         self.slider.setFixedWidth(220)
         tb.addWidget(self.slider)
@@ -437,7 +745,7 @@ class LauncherApp(QMainWindow):
         # refresh
         icon_refresh = self._load_icon("refresh")
         self.act_refresh = QAction(icon_refresh or QIcon(), tr(self, "refresh"), self)
-        self.act_refresh.triggered.connect(self.refresh_rom_list)
+        self.act_refresh.triggered.connect(self.reload_rom_list)
         tb.addAction(self.act_refresh)
 
         # only pinned toggle
@@ -473,11 +781,23 @@ class LauncherApp(QMainWindow):
         self.view.clicked.connect(lambda idx: self._refresh_details_panel())
         self.view.setUniformItemSizes(True)
         self.view.setResizeMode(QListView.Adjust)
+        # QListView 本身只繪製可見項目；再讓版面配置分批進行，大量 ROM 時不會一次排完整份清單卡住 UI
+        self.view.setLayoutMode(QListView.Batched)
+        self.view.setBatchSize(200)
         self.view.setSpacing(12)
         self.view.setContextMenuPolicy(Qt.CustomContextMenu)
         self.view.customContextMenuRequested.connect(self._on_context_menu)
         self.view.doubleClicked.connect(self._double_clicked)
 
+        # 右鍵選單（重複使用，不在每次右鍵時重建）
+        self.ctx_menu = QMenu(self)
+        self.ctx_play = self.ctx_menu.addAction(tr(self, "start_game"))
+        self.ctx_cover = self.ctx_menu.addAction(tr(self, "choose_cover"))
+        self.ctx_pin = self.ctx_menu.addAction(tr(self, "pin_this"))
+        self.ctx_rename = self.ctx_menu.addAction(tr(self, "rename_title"))
+        self.ctx_menu.addSeparator()
+        self.ctx_reveal = self.ctx_menu.addAction(tr(self, "context_reveal"))
+
         # 反向拖曳捲動：在 viewport 上裝 event filter
         self.view.viewport().installEventFilter(self)
 
@@ -492,7 +812,7 @@ class LauncherApp(QMainWindow):
         # 內層：所有元件塞進同一個 VBox，並置頂
         info_box = QFrame()
         info_lay = QVBoxLayout(info_box)
-        s = float(self.config.get("ui_scale", 1.0))
+        s = self._ui_scale
         info_lay.setContentsMargins(0, 0, 0, 0)
         info_lay.setSpacing(int(8 * s))
 
@@ -510,6 +830,7 @@ class LauncherApp(QMainWindow):
         f.setPointSize(max(8, int((f.pointSize()+4) * s)))
         f.setBold(True)
         self.lbl_title.setFont(f)
+        self.lbl_title.setStyleSheet("color: #FFFFFF;")
         self.lbl_title.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Minimum)
         info_lay.addWidget(self.lbl_title)
         # NDS 檔案內建 32x32 圖示（banner icon），顯示於標題下方
@@ -523,6 +844,7 @@ class LauncherApp(QMainWindow):
         self.lbl_path = QLabel("")
         self.lbl_path.setTextInteractionFlags(Qt.TextSelectableByMouse)
         self.lbl_path.setWordWrap(True)
+        self.lbl_path.setStyleSheet("color: #AAAAAA;")
         self.lbl_path.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Minimum)
         info_lay.addWidget(self.lbl_path)
 
@@ -530,6 +852,7 @@ class LauncherApp(QMainWindow):
         self.lbl_code = QLabel("")
         self.lbl_code.setTextInteractionFlags(Qt.TextSelectableByMouse)
         self.lbl_code.setWordWrap(True)
+        self.lbl_code.setStyleSheet("color: #AAAAAA;")
         self.lbl_code.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Minimum)
         info_lay.addWidget(self.lbl_code)
         self._apply_right_label_fonts()
@@ -548,18 +871,22 @@ class LauncherApp(QMainWindow):
         btn_lay.setSpacing(int(6 * s))
 
         self.btn_play = QPushButton(tr(self, "start_game"))
+        self.btn_play.setObjectName("playBtn")
         self.btn_play.clicked.connect(self.launch_selected)
         btn_lay.addWidget(self.btn_play, 0, Qt.AlignLeft)
 
         self.btn_choose_cover = QPushButton(tr(self, "choose_cover"))
+        self.btn_choose_cover.setObjectName("rightBtn")
         self.btn_choose_cover.clicked.connect(self.pick_cover_for_selected)
         btn_lay.addWidget(self.btn_choose_cover, 0, Qt.AlignLeft)
 
         self.btn_pin = QPushButton(tr(self, "pin_this"))
+        self.btn_pin.setObjectName("rightBtn")
         self.btn_pin.clicked.connect(self.pin_toggle_selected)
         btn_lay.addWidget(self.btn_pin, 0, Qt.AlignLeft)
 
         self.btn_rename = QPushButton(tr(self, "rename_title"))
+        self.btn_rename.setObjectName("rightBtn")
         self.btn_rename.clicked.connect(self.rename_selected)
         btn_lay.addWidget(self.btn_rename, 0, Qt.AlignLeft)
 
@@ -597,26 +924,25 @@ class LauncherApp(QMainWindow):
 
 
     def _compute_panel_base_width_once(self):
-        """在啟動 GUI 時掃描一次所有 ROM 的封面，記錄『放大圖』中最寬的寬度作為右欄寬度基準。
-        之後只會用這個基準搭配 ui_scale 做等比例縮放，不再重新掃描。"""
+        """啟動時估出『放大圖』寬度作為右欄寬度基準，之後只搭配 ui_scale 等比例縮放。
+        不再掃描全部 ROM 解碼封面：只讀一張封面的檔頭尺寸估算長寬比，沒有封面時沿用 260 * scale。"""
         if self._panel_base_cover_w is not None:
             return
         s0 = self._panel_base_s  # 啟動時的 scale
-        max_w = 0
+        bw, bh = int(160 * s0) * 2, int(140 * s0) * 2   # grid 放大圖的外框
+        w = 0
         try:
-            # 用掃描器直接抓 ROM 路徑（不依賴 model 是否已就緒）
-            paths = self._scan_roms()
-            for p in paths:
-                cover = self._cover_path_for(p)
-                pm = self._get_thumb(cover, grid=True, double=True, overlay_pin=False)
-                if pm:
-                    max_w = max(max_w, pm.width())
+            sample = next(iter(self._get_covers_index().values()), None)
+            if sample is not None:
+                size = QImageReader(str(sample)).size()   # 只讀檔頭，不解碼
+                if size.isValid() and size.height() > 0:
+                    w = min(bw, int(bh * size.width() / size.height()))
         except Exception:
             pass
         # fallback：若沒有任何封面，給一個和最小寬相近的基準（不含 padding）
-        if max_w <= 0:
-            max_w = int(260 * s0)
-        self._panel_base_cover_w = max_w
+        if w <= 0:
+            w = int(260 * s0)
+        self._panel_base_cover_w = w
 
 
     def _apply_dark_palette(self):
@@ -638,35 +964,52 @@ class LauncherApp(QMainWindow):
 
     def _apply_right_label_fonts(self, base_title=16, base_path=12, base_code=12):
 
-        """讓右欄字體跟著 ui_scale 連動"""
+        """讓右欄字體跟著 ui_scale 連動（顏色在 _build_ui 設定一次即可）"""
 
-        s = float(self.config.get("ui_scale", 0.8))
+        s = self._ui_scale
 
         # 標題
-        f_title = QFont(self.font())
-        f_title.setBold(True)
+        f_title = QFont(self._f_right_title)
         f_title.setPointSize(int(base_title * s))
         self.lbl_title.setFont(f_title)
-        self.lbl_title.setStyleSheet("color: #FFFFFF;")
 
         # 路徑
-        f_path = QFont(self.font())
+        f_path = QFont(self._f_right_plain)
         f_path.setPointSize(int(base_path * s))
         self.lbl_path.setFont(f_path)
-        self.lbl_path.setStyleSheet("color: #AAAAAA;")
 
         # ID
-        f_code = QFont(self.font())
+        f_code = QFont(self._f_right_plain)
         f_code.setPointSize(int(base_code * s))
         self.lbl_code.setFont(f_code)
-        self.lbl_code.setStyleSheet("color: #AAAAAA;")
 
 
+    # 右欄按鈕共用一份樣式表（設在 right_panel 上，以 objectName 區分）
+    # 一般按鈕只設定 padding；開始遊戲：背景綠色，文字白色，含 hover/pressed 狀態
+    _RIGHT_BTN_QSS = """
+        QPushButton#rightBtn {
+            padding: %(pad_v)dpx %(pad_h)dpx;
+        }
+        QPushButton#playBtn {
+            padding: %(pad_v)dpx %(pad_h)dpx;
+            background-color: #28a745;
+            color: white;
+            border: none;
+            border-radius: %(radius)dpx;
+        }
+        QPushButton#playBtn:hover {
+            background-color: #186029;
+        }
+        QPushButton#playBtn:pressed {
+            background-color: #0d3416;
+        }
+    """
+
     def _apply_right_button_scale(self, base_font=12, base_height=32, base_hpadding=12):
 
         """讓右欄四個按鈕（含字體）隨 ui_scale 調整"""
-        s = float(self.config.get("ui_scale", 1.0))
-        f_btn = QFont(self.font())
+        s = self._ui_scale
+        f_btn = QFont(self._f_right_plain)
         f_btn.setPointSize(int(base_font * s))
         pad_v = int(6 * s)
         pad_h = int(base_hpadding * s)
@@ -677,56 +1020,49 @@ class LauncherApp(QMainWindow):
             btn.setFont(f_btn)
             btn.setMinimumHeight(h)
 
-            # 用樣式控制左右 padding；避免覆蓋其他樣式，只設定 padding
-            btn.setStyleSheet(f"padding: {pad_v}px {pad_h}px;")
-
-        # 開始遊戲：背景綠色，文字白色，含 hover/pressed 狀態
-        self.btn_play.setStyleSheet(
-            f"""
-                QPushButton {{
-                    padding: {pad_v}px {pad_h}px;
-                    background-color: #28a745;
-                    color: white;
-                    border: none;
-                    border-radius: {int(6 * s)}px;
-                }}
-                QPushButton:hover {{
-                    background-color: #186029;
-                }}
-                QPushButton:pressed {{
-                    background-color: #0d3416;
-                }}
-            """
-        )
+        # 只解析一次樣式表，不再逐顆按鈕 setStyleSheet
+        self.right_panel.setStyleSheet(self._RIGHT_BTN_QSS % {
+            "pad_v": pad_v, "pad_h": pad_h, "radius": int(6 * s)})
 
     def _on_zoom_changed(self, val: int):
+        # 拖曳滑桿時只更新百分比；重新排版/重算縮圖合併到停止拖動後做一次
         self.lbl_zoom_pct.setText(f"{val}%")
+        self._zoom_timer.start()
+
+    def _apply_zoom(self):
+        val = self.slider.value()
         s = max(60, min(220, int(val))) / 100.0
         self.config["ui_scale"] = s
-        save_json(self.config_path, self.config)
+        self._ui_scale = s
+        self._schedule_save_config()
+        self._cancel_pending_thumbs()
         # 調整清單呈現
         self._apply_view_mode()
         self.view.viewport().update()
-        # 右側標題字體也跟著縮放
-        f = self.lbl_title.font(); f.setPointSize(max(8, int((self.font().pointSize()+4) * s)))
-        f.setBold(True); self.lbl_title.setFont(f)
+        # 右側標題/路徑/ID 字體也跟著縮放
         self._apply_right_label_fonts()
         self._apply_right_button_scale()
         self._update_right_cover_size()
         self._update_right_nds_icon()
 
     def _on_search_changed(self, txt: str):
-        self.proxy.setFilterString(txt)
+        # 打字時延遲套用，連續輸入只過濾一次
+        self._search_timer.start()
 
     def _set_view_mode(self, mode: str):
         self._view_mode = mode
         self.config["view_mode"] = mode
-        save_json(self.config_path, self.config)
+        self._schedule_save_config()
+        self._cancel_pending_thumbs()
         self._apply_view_mode()
         self.view.viewport().update()
 
     def _apply_view_mode(self):
-        s = float(self.config.get("ui_scale", 1.0))
+        s = self._ui_scale
+        # setViewMode 會讓整份清單重新排版；模式與縮放都沒變時直接略過
+        if self._applied_view == (self._view_mode, s):
+            return
+        self._applied_view = (self._view_mode, s)
         if self._view_mode == "grid":
             self.view.setViewMode(QListView.IconMode)
             self.view.setVerticalScrollMode(QListView.ScrollPerPixel)
@@ -744,24 +1080,29 @@ class LauncherApp(QMainWindow):
 
     def _toggle_lang(self):
         self.lang = "en" if self.lang == "zh" else "zh"
+        self._tr = _TR_EN if self.lang == "en" else _TR_ZH
         self.config["lang"] = self.lang
-        save_json(self.config_path, self.config)
+        self._schedule_save_config()
         # 更新 toolbar/右側文字
-        self.lbl_rom.setText(tr(self, "rom_dir"))
-        self.lbl_mel.setText(tr(self, "melonds"))
-        self.lbl_search.setText(tr(self, "search"))
-        self.lbl_view.setText(tr(self, "view"))
-        self.lbl_zoom.setText(tr(self, "zoom"))
-        self.act_lang.setText(tr(self, "language"))
-        self.act_only_pin.setText(tr(self, "only_pinned_tip"))
-        self.act_refresh.setText(tr(self, "refresh"))
-        self.btn_play.setText(tr(self, "start_game"))
-        self.btn_choose_cover.setText(tr(self, "choose_cover"))
-        self.btn_rename.setText(tr(self, "rename_title"))
-        # pin button會在選取時同步更新
+        self.lbl_rom.setText(self._tr["rom_dir"])
+        self.lbl_mel.setText(self._tr["melonds"])
+        self.lbl_search.setText(self._tr["search"])
+        self.lbl_view.setText(self._tr["view"])
+        self.lbl_zoom.setText(self._tr["zoom"])
+        self.act_lang.setText(self._tr["language"])
+        self.act_only_pin.setText(self._tr["only_pinned_tip"])
+        self.act_refresh.setText(self._tr["refresh"])
+        self.btn_play.setText(self._tr["start_game"])
+        self.btn_choose_cover.setText(self._tr["choose_cover"])
+        self.btn_rename.setText(self._tr["rename_title"])
+        self.ctx_play.setText(self._tr["start_game"])
+        self.ctx_cover.setText(self._tr["choose_cover"])
+        self.ctx_rename.setText(self._tr["rename_title"])
+        self.ctx_reveal.setText(self._tr["context_reveal"])
+        # pin button / 右鍵 pin 項目會在選取或彈出時同步更新
 
         if not self._selected_index():
-            self.lbl_title.setText(tr(self, "not_selected"))
+            self.lbl_title.setText(self._tr["not_selected"])
 
         # code label refresh
         self._refresh_details_panel()
@@ -769,7 +1110,7 @@ class LauncherApp(QMainWindow):
     def _toggle_only_pinned(self):
         self._only_pinned = not self._only_pinned
         self.config["only_pinned"] = self._only_pinned
-        save_json(self.config_path, self.config)
+        self._schedule_save_config()
         self.refresh_rom_list()
 
     def _selected_index(self) -> Optional[QModelIndex]:
@@ -779,16 +1120,13 @@ class LauncherApp(QMainWindow):
     def _select_path(self, path_str: str):
         """在重新整理列表後，根據 Roles.Path 重新選取指定路徑的遊戲。"""
         target = (path_str or "").replace("\\", "/")
-        try:
-            rows = self.proxy.rowCount()
-        except Exception:
-            rows = 0
-        for r in range(rows):
-            idx = self.proxy.index(r, 0)
-            p = self.proxy.data(idx, Roles.Path) or ""
-            if p == target:
-                self.view.setCurrentIndex(idx)
-                self.view.scrollTo(idx, QListView.PositionAtCenter)
+        # 直接比對 GameItem 預先正規化的 spath，找到後再映射到 proxy 列
+        for row, g in enumerate(self.model._items):
+            if g.spath == target:
+                idx = self.proxy.mapFromSource(self.model.index(row, 0))
+                if idx.isValid():
+                    self.view.setCurrentIndex(idx)
+                    self.view.scrollTo(idx, QListView.PositionAtCenter)
                 break
         self._refresh_details_panel()
 
@@ -899,23 +1237,18 @@ class LauncherApp(QMainWindow):
         self.view.setCurrentIndex(idx)
         g = self._current_item()
         if not g: return
-        m = QMenu(self)
-        a_play = m.addAction(tr(self, "start_game"))
-        a_cover = m.addAction(tr(self, "choose_cover"))
-        a_pin = m.addAction(tr(self, "unpin") if g.pinned else tr(self, "pin_this"))
-        a_rename = m.addAction(tr(self, "rename_title"))
-        m.addSeparator()
-        a_reveal = m.addAction(tr(self, "context_reveal"))
-        act = m.exec(QCursor.pos())
-        if act == a_play:
+        # 選單只建立一次；彈出前只需同步釘選狀態
+        self.ctx_pin.setText(self._tr["unpin"] if g.pinned else self._tr["pin_this"])
+        act = self.ctx_menu.exec(QCursor.pos())
+        if act == self.ctx_play:
             self._launch(g.path)
-        elif act == a_cover:
-            self._pick_cover_for(g.path)
-        elif act == a_pin:
+        elif act == self.ctx_cover:
+            self._pick_cover_for(g.path, g.gid)
+        elif act == self.ctx_pin:
             self.pin_toggle_selected()
-        elif act == a_rename:
-            self._rename_title(g.path)
-        elif act == a_reveal:
+        elif act == self.ctx_rename:
+            self._rename_title(g.path, g.gid)
+        elif act == self.ctx_reveal:
             self._reveal(g.path)
 
     def _double_clicked(self, idx: QModelIndex):
@@ -924,159 +1257,385 @@ class LauncherApp(QMainWindow):
         self._launch(g.path)
 
     # ---- 檔案/資料邏輯（沿用原始 JSON 結構） ---- #
-    def _ensure_title_for(self, rom_path: Path):
-        gid = game_id_for(rom_path)
+    def _nds_info(self, rom_path: Path) -> Tuple[str, str, str]:
+        """回傳 (title, code, gid)；以 (mtime_ns, size) 驗證快取，命中時不開檔。"""
+        key = str(rom_path)
+        try:
+            st = self._stat_rom(key)
+        except OSError:
+            return "", "", rom_path.stem.lower()
+        hit = self._nds_info_cache.get(key)
+        if hit and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+            return hit[2], hit[3], hit[4]
+        entry = self._read_nds_entry(rom_path, st)
+        self._nds_info_cache[key] = entry
+        self._nds_info_dirty = True
+        return entry[2], entry[3], entry[4]
+
+    def _stat_rom(self, key: str) -> os.stat_result:
+        """同一次 refresh 內每個 ROM 只 stat 一次（顯示名稱、封面、gid 都會查檔頭快取）。"""
+        st = self._rom_stats.get(key)
+        if st is None:
+            st = os.stat(key)
+            self._rom_stats[key] = st
+        return st
+
+    def _read_nds_entry(self, rom_path: Path, st: os.stat_result) -> Tuple[int,int,str,str,str]:
+        head = read_nds_head(rom_path)
+        title, code = parse_nds_head(head)
+        gid = game_id_for(rom_path, head)
+        return (st.st_mtime_ns, st.st_size, title, code, gid)
+
+    def _prefetch_nds_info(self, paths: List[Path]) -> bool:
+        """快取內沒有的檔頭切成數段，交給 _header_executor 平行讀取，GUI 不必等待。
+        已排入背景（或仍在讀取）時回傳 True；每段讀完由 _on_nds_info_ready 寫回快取，
+        全部分段回報後再 refresh 一次。
+        送出過的路徑記在 _nds_info_attempted，讀取失敗也不會在下一次 refresh 又整批重送。"""
+        if self._scan_pending:
+            return True
+        attempted = self._nds_info_attempted
+        missing = [p for p in paths
+                   if str(p) not in self._nds_info_cache and str(p) not in attempted]
+        if len(missing) < 2:
+            return False
+        attempted.update(str(p) for p in missing)
+        # stat 結果在 GUI 執行緒先取出；背景工作不碰 LauncherApp 的快取 dict
+        jobs = [(p, self._rom_stats.get(str(p))) for p in missing]
+        step = max(16, -(-len(jobs) // self._header_workers))
+        for i in range(0, len(jobs), step):
+            self._header_executor.submit(self._read_nds_info_job, jobs[i:i+step])
+            self._scan_pending += 1
+        return True
+
+    def _read_nds_info_job(self, jobs: List[Tuple[Path, Optional[os.stat_result]]]):
+        """背景執行緒：依序讀取一段檔頭，個別檔案失敗也照常回報，結果經 signal 交回 GUI 執行緒。"""
+        results = []
+        for rom_path, st in jobs:
+            try:
+                if st is None:
+                    st = os.stat(rom_path)
+                results.append((str(rom_path), self._read_nds_entry(rom_path, st)))
+            except Exception:
+                continue
+        self._scan_signals.done.emit(results)
+
+    def _on_nds_info_ready(self, results):
+        self._scan_pending -= 1
+        for key, entry in results:
+            self._nds_info_cache[key] = entry
+            self._nds_info_dirty = True
+        if not self._scan_pending:
+            self.refresh_rom_list()
+
+    def _evict_nds_info(self, paths: List[Path]):
+        """丟掉已不在 ROM 目錄內的檔頭快取（刪除、改名或換目錄）。
+        _nds_info_attempted 也一併縮小，回到先前的目錄時才會再交給背景讀取。"""
+        live = {str(p) for p in paths}
+        stale = [k for k in self._nds_info_cache if k not in live]
+        for k in stale:
+            del self._nds_info_cache[k]
+        if stale:
+            self._nds_info_dirty = True
+        self._nds_info_attempted.intersection_update(live)
+
+    def _save_nds_info(self):
+        if self._nds_info_dirty:
+            save_json(self.nds_info_path, self._nds_info_cache)
+            self._nds_info_dirty = False
+
+    def _schedule_save_config(self):
+        """重新計時，停止操作 250ms 後才寫入設定檔。"""
+        self._cfg_save_timer.start()
+
+    def closeEvent(self, event):
+        if self._cfg_save_timer.isActive():
+            self._cfg_save_timer.stop()
+            save_json(self.config_path, self.config)
+        self._cover_executor.shutdown(wait=False, cancel_futures=True)
+        self._header_executor.shutdown(wait=False, cancel_futures=True)
+        self._save_nds_info()
+        self._save_titles()
+        super().closeEvent(event)
+
+    def _ensure_title_for(self, rom_path: Path, gid: Optional[str] = None):
+        if gid is None:
+            gid = self._nds_info(rom_path)[2]
         if not self.titles_map.get(gid):
             self.titles_map[gid] = rom_path.stem
-            save_json(self.titles_path, self.titles_map)
+            self._titles_dirty = True
 
-    def _display_name_for(self, rom_path: Path) -> str:
-        self._ensure_title_for(rom_path)
-        gid = game_id_for(rom_path)
+    def _save_titles(self):
+        if self._titles_dirty:
+            save_json(self.titles_path, self.titles_map)
+            self._titles_dirty = False
+
+    def _display_name_for(self, rom_path: Path, gid: Optional[str] = None) -> str:
+        key = str(rom_path)
+        name = self._dn_cache.get(key)
+        if name is not None:
+            return name
+        if gid is None:
+            gid = self._nds_info(rom_path)[2]
+        self._ensure_title_for(rom_path, gid)
         name = self.titles_map.get(gid) or rom_path.stem
+        self._dn_cache[key] = name
         return name
 
-    def _cover_path_for(self, rom_path: Path) -> Optional[Path]:
-        gid = game_id_for(rom_path)
-        p = self.covers_map.get(gid)
-        if p and Path(p).exists(): return Path(p)
-        for ext in IMG_EXTS:
-            guess = self.covers_path / f"{rom_path.stem}{ext}"
-            if guess.exists(): return guess
-        return None
-
-    def _is_pinned(self, p: Path) -> bool:
-        files = set(self.config.get("pinned_files", []))
-        return p.name in files
-
-    def _scan_roms(self) -> List[Path]:
+    def _cover_path_for(self, rom_path: Path, gid: Optional[str] = None) -> Optional[Path]:
+        key = str(rom_path)
+        if key in self._covers_valid:
+            return self._covers_valid[key]
+        if gid is None:
+            gid = self._nds_info(rom_path)[2]
+        cover = self._get_covers_resolved().get(gid) or self._get_covers_index().get(rom_path.stem.lower())
+        self._covers_valid[key] = cover
+        return cover
+
+    def _get_covers_resolved(self) -> Dict[str, Path]:
+        """covers_map 只在第一次查詢時逐筆確認檔案存在，不必每次 refresh 都對每筆 stat。"""
+        if self._covers_resolved is None:
+            self._covers_resolved = {gid: Path(p) for gid, p in self.covers_map.items()
+                                     if p and os.path.isfile(p)}
+        return self._covers_resolved
+
+    def _get_covers_index(self) -> Dict[str, Path]:
+        """covers 資料夾清單（小寫 stem -> Path），一次 scandir 取代逐檔 exists()；refresh 時失效。"""
+        if self._covers_index is None:
+            index: Dict[str, Path] = {}
+            rank: Dict[str, int] = {}
+            exts = [e.lower() for e in IMG_EXTS]
+            try:
+                with os.scandir(self.covers_path) as it:
+                    for e in it:
+                        stem, ext = os.path.splitext(e.name)
+                        ext = ext.lower()
+                        if ext not in exts or not e.is_file():
+                            continue
+                        k = stem.lower()
+                        # 同名多種副檔名時依 IMG_EXTS 順序優先
+                        if k not in index or exts.index(ext) < rank[k]:
+                            index[k] = Path(e.path)
+                            rank[k] = exts.index(ext)
+            except OSError:
+                pass
+            self._covers_index = index
+        return self._covers_index
+
+    def _list_rom_files(self, rom_dir: Path) -> List[Path]:
+        """以 os.scandir 遞迴列出 ROM（DirEntry 自帶型別，不必逐檔 stat）。
+        記錄每個資料夾的 mtime；下次若全部未變（沒有新增/刪除/改名）就直接沿用上次結果。"""
+        root = str(rom_dir)
+        cached = self._scan_cache
+        if cached and cached[0] == root:
+            try:
+                if all(os.stat(d).st_mtime_ns == m for d, m in cached[1].items()):
+                    return list(cached[2])
+            except OSError:
+                pass
+        dir_mtimes: Dict[str, int] = {}
+        files: List[str] = []
+        stack = [root]
+        while stack:
+            d = stack.pop()
+            try:
+                dir_mtimes[d] = os.stat(d).st_mtime_ns
+                with os.scandir(d) as it:
+                    for e in it:
+                        if e.is_dir(follow_symlinks=False):
+                            stack.append(e.path)
+                        elif e.name.lower().endswith(ROM_EXT_TUPLE) and e.is_file():
+                            files.append(e.path)
+                            try:
+                                # Windows 上 DirEntry.stat() 不需額外系統呼叫；順便供檔頭快取驗證
+                                self._rom_stats[e.path] = e.stat()
+                            except OSError:
+                                pass
+            except OSError:
+                continue
+        files.sort()
+        roms = [Path(f) for f in files]
+        self._scan_cache = (root, dir_mtimes, roms)
+        return list(roms)
+
+    def _scan_roms(self) -> Optional[List[Tuple[Path, str, bool, str]]]:
+        """回傳排序後的 (路徑, 顯示名稱, 是否釘選, gid)；每個 ROM 只查一次檔頭快取與標題。
+        檔頭仍在背景讀取時回傳 None。"""
         rom_dir = Path(self.ed_rom.text().strip() or self.config.get("rom_dir",""))
-        query = (self.ed_search.text() or "").lower().strip()
-        out: List[Path] = []
+        roms: List[Path] = []
         if rom_dir and rom_dir.exists():
-            for p in sorted(rom_dir.glob("**/*")):
-                if p.is_file() and p.suffix in SUPPORTED_EXTS:
-                    self._ensure_title_for(p)
-                    disp = self._display_name_for(p)
-                    name_for_search = (disp + " " + p.name).lower()
-                    if query and (query not in name_for_search):
-                        continue
-                    out.append(p)
+            roms = self._list_rom_files(rom_dir)
+            self._evict_nds_info(roms)
+            if self._prefetch_nds_info(roms):
+                return None
+        self._last_scan = roms
+        self._last_gids = {}
+        return self._sort_entries(roms)
+
+    def _sort_entries(self, roms: List[Path]) -> List[Tuple[Path, str, bool, str]]:
+        """依搜尋字串/只顯示釘選過濾，並以「釘選優先、標題」排序；gid 記在 _last_gids 供下次沿用。"""
+        query = (self.ed_search.text() or "").casefold().strip()
+        if query.startswith("re:"):
+            query = ""   # 正規表示式搜尋只交給 proxy 過濾
+        gids = self._last_gids
+        pins = self._pin_set
         if self._only_pinned:
-            out = [p for p in out if self._is_pinned(p)]
-        out = sorted(out, key=lambda x: (0 if self._is_pinned(x) else 1, self._display_name_for(x).lower()))
-        return out
+            roms = [p for p in roms if p.name in pins]
+        # 排序鍵每個 ROM 只算一次（decorate-sort-undecorate；同名時維持掃描順序）
+        decorated = []
+        for i, p in enumerate(roms):
+            gid = gids.get(p)
+            if gid is None:
+                gid = gids[p] = self._nds_info(p)[2]
+            disp = self._display_name_for(p, gid)
+            if query and query not in (disp + " " + p.name).casefold():
+                continue
+            pinned = p.name in pins
+            decorated.append((not pinned, disp.lower(), i, p, disp, gid))
+        decorated.sort()
+        return [(d[3], d[4], not d[0], d[5]) for d in decorated]
 
     def refresh_rom_list(self):
-        paths = self._scan_roms()
+        self._dn_cache.clear()
+        self._rom_stats.clear()
+        self._covers_index = None
+        self._covers_valid.clear()
+        self._thumb_failed.clear()
+        entries = self._scan_roms()
+        if entries is None:
+            # 檔頭仍在背景讀取；讀完會自動再 refresh，這段期間 UI 維持可操作
+            self.statusBar().showMessage("讀取 ROM 資訊中…")
+            return
+        self._apply_entries(entries)
+        # 啟動自動封面抓取（背景）
+        try:
+            self._schedule_auto_fetch_covers([it for it in self.model._items if not it.cover])
+        except Exception:
+            pass
+
+    def reload_rom_list(self):
+        """明確的重新整理（按鈕、換 ROM 目錄）：重新檢查 covers_map 的檔案，
+        外部刪除的封面才會改回依檔名比對並重新排入自動抓取。
+        目錄也一律重掃：FAT/exFAT 或 mtime 精度粗的檔案系統上，新增 ROM 不一定會改變資料夾 mtime。"""
+        self._covers_resolved = None
+        self._scan_cache = None
+        self.refresh_rom_list()
+
+    def _rebuild_items_from_cache(self):
+        """釘選/改名時檔案組成不變：沿用上次掃描的清單與 gid、封面解析結果，
+        只重算顯示名稱、釘選與排序，不掃目錄也不逐檔 stat。"""
+        if self._last_scan is None:
+            self.refresh_rom_list()
+            return
+        self._dn_cache.clear()
+        self._apply_entries(self._sort_entries(self._last_scan))
+
+    def _apply_entries(self, entries: List[Tuple[Path, str, bool, str]]):
         items: List[GameItem] = []
-        for p in paths:
+        for p, disp, pinned, gid in entries:
             items.append(GameItem(
                 path=p,
-                title=self._display_name_for(p),
-                cover=self._cover_path_for(p),
-                pinned=self._is_pinned(p)
+                title=disp,
+                cover=self._cover_path_for(p, gid),
+                pinned=pinned,
+                gid=gid
             ))
-        # reset model
-        self.model.beginResetModel()
-        self.model._items = items
-        self.model.endResetModel()
-        self.proxy.invalidate()
-        self.statusBar().showMessage(f"掃描完成：{len(items)} 個 ROM", 3000)
-        self._refresh_details_panel()
-        self._update_right_cover_size()
-        self._update_right_nds_icon()
-        # 啟動自動封面抓取（背景）
+        self._rom_stats.clear()
+        # 掃描結束即寫回檔頭快取與新標題（僅在有變動時），不必等到關閉視窗
+        self._save_nds_info()
+        self._save_titles()
+        # 更新 model 與右欄期間先暫停重繪，結束後只重繪一次
+        self.setUpdatesEnabled(False)
         try:
-            missing = [it.path for it in self.model._items if not self._cover_path_for(it.path)]
-            self._schedule_auto_fetch_covers(missing)
-        except Exception:
-            pass
+            # 只在清單組成/順序改變時才 reset model，否則就地更新有變動的列
+            self.model.setItems(items)
+            self._prefetch_thumbs(items)
+            self.statusBar().showMessage(f"掃描完成：{len(items)} 個 ROM", 3000)
+            # 右欄寬度、封面與 NDS 圖示都在 _refresh_details_panel 內處理，不再重複呼叫
+            self._refresh_details_panel()
+        finally:
+            self.setUpdatesEnabled(True)
     
     def _refresh_details_panel(self):
         g = self._current_item()
+        # 點選同一款遊戲（clicked 與 currentChanged 會各觸發一次）且內容未變時不重畫右欄
+        sig = (g.spath, g.title, g.pinned, g.scover, self.lang) if g else (None, self.lang)
+        if sig == self._details_sig:
+            return
+        self._details_sig = sig
         if not g:
-            self.lbl_title.setText(tr(self, "not_selected"))
+            self.lbl_title.setText(self._tr["not_selected"])
             self.lbl_path.setText("")
             self.lbl_code.setText("")
-            self.right_cover.setPixmap(QPixmap())
+            self._update_right_cover_size()   # 無選取時也要套用右欄寬度並清空封面
             self.right_nds_icon.setPixmap(QPixmap())
-            self.btn_pin.setText(tr(self, "pin_this"))
+            self.btn_pin.setText(self._tr["pin_this"])
             return
         self.lbl_title.setText((g.title or g.path.stem).replace("_", ""))
-        self.lbl_path.setText(str(g.path).replace("\\", "/"))
-        gid = game_id_for(g.path)
-        t, code = read_nds_info(g.path)
+        self.lbl_path.setText(g.spath)
+        gid = g.gid
+        code = self._nds_info(g.path)[1]
         extra = f"（{code}）" if code else ""
-        self.lbl_code.setText(f"{tr(self,'id_label')}{gid}{extra}")
-        self.btn_pin.setText(tr(self, "unpin") if g.pinned else tr(self, "pin_this"))
+        self.lbl_code.setText(f"{self._tr['id_label']}{gid}{extra}")
+        self.btn_pin.setText(self._tr["unpin"] if g.pinned else self._tr["pin_this"])
         # nds icon + cover
         self._update_right_nds_icon()
         self._update_right_cover_size()
-        self._update_right_nds_icon()
 
     
     # ---- NDS Banner Icon 解碼與右欄更新 ---- #
-    def _get_nds_icon_pixmap(self, rom_path: Path, scale: int) -> Optional[QPixmap]:
+    def _get_nds_icon_base(self, rom_path: Path, mtime_ns: int) -> Optional[QPixmap]:
         """
         從 .nds 檔讀取 32x32 的 banner icon：4bpp/16色、RGB555 調色盤。
-        讀取成功回傳放大後的 QPixmap，並快取；失敗回傳 None。
+        以原始 32x32 快取（鍵含 mtime，ROM 更新後自動失效）；沒有圖示回傳 None。
         """
+        key = f"nds_icon|{rom_path}|{mtime_ns}"
+        pm = QPixmapCache.find(key)
+        if pm is not None:
+            return pm
+        if key in self._nds_icon_missing:
+            return None
         try:
-            key = (str(rom_path), int(scale))
-            if key in self._nds_icon_cache:
-                return self._nds_icon_cache[key]
             with open(rom_path, "rb") as f:
                 head = f.read(0x200)
                 if len(head) < 0x200:
-                    return None
+                    raise ValueError("short header")
                 # 0x68: icon/banner 在檔案中的位移（uint32 little-endian）
                 (banner_off,) = struct.unpack("<I", head[0x68:0x6C])
                 if banner_off == 0:
-                    return None
+                    raise ValueError("no banner")
                 # 0x20: 32x32, 4bpp, 共 512 bytes 的像素資料（分 16 個 8x8 tiles）
                 f.seek(banner_off + 0x20)
                 tile_bytes = f.read(512)
-                if len(tile_bytes) != 512:
-                    return None
                 # 0x220: 16 色調色盤（RGB555, 32 bytes）
                 f.seek(banner_off + 0x220)
                 pal_bytes = f.read(32)
-                if len(pal_bytes) != 32:
-                    return None
-
-            # 轉調色盤為 RGBA
-            palette = []
-            for i in range(16):
-                v = pal_bytes[2*i] | (pal_bytes[2*i+1] << 8)
-                r = (v & 0x1F) * 255 // 31
-                g = ((v >> 5) & 0x1F) * 255 // 31
-                b = ((v >> 10) & 0x1F) * 255 // 31
-                a = 0 if i == 0 else 255  # index 0 視為透明
-                palette.append((r, g, b, a))
-
-            # 解 4bpp tiled: 4x4 tiles，每 tile 8x8；每 tile 32 bytes
-            img = QImage(32, 32, QImage.Format_ARGB32)
-            for ty in range(4):
-                for tx in range(4):
-                    base = (ty * 4 + tx) * 32
-                    for py in range(8):
-                        for px in range(8):
-                            p_index = py * 8 + px
-                            byte = tile_bytes[base + (p_index // 2)]
-                            idx = (byte & 0x0F) if (p_index % 2) == 0 else ((byte >> 4) & 0x0F)
-                            r, g, b, a = palette[idx]
-                            x = tx * 8 + px
-                            y = ty * 8 + py
-                            img.setPixel(x, y, (a << 24) | (r << 16) | (g << 8) | b)
-
-            pm = QPixmap.fromImage(img)
-            if scale and scale != 32:
-                pm = pm.scaled(scale, scale, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            self._nds_icon_cache[key] = pm
-            return pm
+            if len(tile_bytes) != 512 or len(pal_bytes) != 32:
+                raise ValueError("truncated banner")
+            pm = QPixmap.fromImage(decode_nds_icon(tile_bytes, pal_bytes))
         except Exception:
+            self._nds_icon_missing.add(key)
+            return None
+        QPixmapCache.insert(key, pm)
+        return pm
+
+    def _get_nds_icon_pixmap(self, rom_path: Path, scale: int) -> Optional[QPixmap]:
+        """回傳放大到 scale 的 banner icon；縮放只從快取的 32x32 原圖做，不重讀檔案。失敗回傳 None。"""
+        try:
+            mtime_ns = os.stat(rom_path).st_mtime_ns
+        except OSError:
             return None
+        key = f"nds_icon|{rom_path}|{mtime_ns}|{int(scale)}"
+        pm = QPixmapCache.find(key)
+        if pm is not None:
+            return pm
+        base = self._get_nds_icon_base(rom_path, mtime_ns)
+        if base is None:
+            return None
+        pm = base
+        if scale and scale != 32:
+            pm = base.scaled(scale, scale, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            QPixmapCache.insert(key, pm)
+        return pm
 
     def _update_right_nds_icon(self):
         """依目前選取的 ROM 刷新右欄的 .nds 內建圖示。"""
@@ -1086,7 +1645,7 @@ class LauncherApp(QMainWindow):
         if not g:
             self.right_nds_icon.setPixmap(QPixmap())
             return
-        s = float(self.config.get("ui_scale", 1.0))
+        s = self._ui_scale
         # 讓 100% 時約 64px，隨 ui_scale 伸縮
         size = max(24, int(48 * s))
         pm = self._get_nds_icon_pixmap(g.path, size)
@@ -1097,45 +1656,56 @@ class LauncherApp(QMainWindow):
 
     
     def _update_right_cover_size(self):
-        """右欄寬度只依啟動時掃描的『最寬封面』做等比例縮放；不再隨選取/列表變動。
-        畫面上仍會顯示目前選取遊戲的封面，但寬度基準固定來自啟動時的最大封面寬。"""
-        s = float(self.config.get("ui_scale", 1.0))
-        min_width = int(300 * s)    # 右欄最小寬度，避免文字/按鈕擠壓
-        padding = int(40 * s)       # 右欄內邊距
-
-        # 基準寬（不含 padding）：來自啟動時掃描的最大封面「放大圖」寬度
-        if self._panel_base_cover_w is None:
-            # 萬一還沒掃描到，做一次；理論上在 __init__ 會先算過
-            self._compute_panel_base_width_once()
-
-        base_w = self._panel_base_cover_w or int(260 * self._panel_base_s)
-
-        # 依目前 s 對基準寬做等比例縮放（啟動時 s0 -> 現在 s）
-        ratio = s / max(0.0001, self._panel_base_s)
-        scaled_w = int(base_w * ratio)
-
-        # 右欄最終寬度
-        panel_w = max(scaled_w + padding, min_width)
-        self.right_panel.setFixedWidth(panel_w)
+        """右欄寬度只依啟動時以單張封面估出的『放大圖』寬度做等比例縮放；不再隨選取/列表變動。
+        畫面上仍會顯示目前選取遊戲的封面，但寬度基準固定來自 _compute_panel_base_width_once。"""
+        s = self._ui_scale
+        # 寬度只取決於 s（基準寬啟動後固定），同一縮放下不重算、不重設
+        if self._panel_w_scale != s:
+            min_width = int(300 * s)    # 右欄最小寬度，避免文字/按鈕擠壓
+            padding = int(40 * s)       # 右欄內邊距
+
+            # 基準寬（不含 padding）：啟動時以單張封面估出的「放大圖」寬度
+            if self._panel_base_cover_w is None:
+                # 萬一還沒估算，做一次；理論上在 __init__ 會先算過
+                self._compute_panel_base_width_once()
+
+            base_w = self._panel_base_cover_w or int(260 * self._panel_base_s)
+
+            # 依目前 s 對基準寬做等比例縮放（啟動時 s0 -> 現在 s）
+            ratio = s / max(0.0001, self._panel_base_s)
+            scaled_w = int(base_w * ratio)
+
+            # 右欄最終寬度
+            panel_w = max(scaled_w + padding, min_width)
+            self.right_panel.setFixedWidth(panel_w)
+            self._panel_w_scale = s
 
         # 顯示目前選取的封面（不影響寬度）
         g_sel = self._current_item()
         if g_sel:
-            pm = self._get_thumb(g_sel.cover, grid=True, double=True, overlay_pin=g_sel.pinned)
-            self.right_cover.setPixmap(pm or QPixmap())
+            # 放大圖也在背景解碼；完成後 _on_thumb_ready 會再呼叫本函式補上
+            pm = self._get_thumb(g_sel.scover, grid=True, double=True, overlay_pin=g_sel.pinned)
         else:
-            self.right_cover.setPixmap(QPixmap())
+            pm = None
+        # 同一張 pixmap 已在顯示中就不再 setPixmap（避免 QLabel 重新排版）
+        # QPixmapCache 每次 find 都回傳新的包裝物件，以 cacheKey 判斷是否同一張
+        cur = self._right_cover_pm
+        if pm is None or cur is None or pm.cacheKey() != cur.cacheKey():
+            self._right_cover_pm = pm
+            self.right_cover.setPixmap(pm or QPixmap())
         return
 
     # ---- 自動抓封面：啟動與更新 ---- #
-    def _schedule_auto_fetch_covers(self, rom_paths):
-        if not rom_paths:
+    def _schedule_auto_fetch_covers(self, items: List[GameItem]):
+        if not items:
             return
         if not bool(self.config.get("auto_download_covers", True)):
             return
         try:
+            # 快取只在 GUI 執行緒讀寫：GameCode 在這裡先查好再交給背景
+            jobs = [(it.path, it.gid, it.title, self._nds_info(it.path)[1]) for it in items]
             self._fetch_thread = QThread(self)
-            self._fetch_worker = CoverFetcher(self, rom_paths)
+            self._fetch_worker = CoverFetcher(self, jobs)
             self._fetch_worker.moveToThread(self._fetch_thread)
             self._fetch_thread.started.connect(self._fetch_worker.run)
             self._fetch_worker.found.connect(self._on_cover_found)
@@ -1150,19 +1720,18 @@ class LauncherApp(QMainWindow):
         # 更新 covers_map.json
         try:
             self.covers_map[gid] = cover_path
+            self._get_covers_resolved()[gid] = Path(cover_path)
+            self._covers_valid.clear()
+            self._forget_cover(Path(cover_path))
             save_json(self.map_path, self.covers_map)
         except Exception:
             pass
-        # 產生縮圖、更新 model 顯示
-        try:
-            self._ensure_thumb_for(Path(cover_path))
-        except Exception:
-            pass
+        # 縮圖由 _render_thumb_job 在背景產生（_ensure_thumb_for 以 mtime 判斷是否需重建）
         # 在模型中找到對應項目並更新封面
         try:
             for i, it in enumerate(self.model._items):
-                if game_id_for(it.path) == gid:
-                    it.cover = Path(cover_path)
+                if it.gid == gid:
+                    it.set_cover(Path(cover_path))
                     sidx = self.model.index(i, 0)
                     self.model.dataChanged.emit(sidx, sidx, [Roles.Cover])
                     break
@@ -1172,14 +1741,11 @@ class LauncherApp(QMainWindow):
         self._refresh_details_panel()
 
     # ---- 嘗試下載指定 ROM 的封面 ---- #
-    def _try_download_cover_for(self, rom_path: Path) -> Optional[Path]:
-        # 若本地已存在就不再下載
-        exist = self._cover_path_for(rom_path)
-        if exist and Path(exist).exists():
-            return exist
+    def _try_download_cover_for(self, rom_path: Path, title_disp: str, code: str) -> Optional[Path]:
+        """背景執行緒：只處理呼叫端給的名稱/代號與網路下載，不讀寫 LauncherApp 的快取。
+        只會對目前沒有封面的 ROM 呼叫（見 _schedule_auto_fetch_covers）。"""
         timeout_sec = int(self.config.get("cover_timeout_sec", 7))
-        title_disp = self._display_name_for(rom_path)
-        code = (read_nds_info(rom_path)[1] or "").strip()
+        code = (code or "").strip()
         # 候選檔名（給 libretro）
         # 1) 顯示名稱（把 _ 換成空白）
         candidates = []
@@ -1260,18 +1826,24 @@ class LauncherApp(QMainWindow):
         return self.thumb_path / f"{cover_path.stem}.jpg"
 
     def _ensure_thumb_for(self, cover_path):
-        """若縮圖不存在則建立；成功回傳縮圖路徑。"""
+        """若縮圖不存在或比封面舊則建立；成功回傳縮圖路徑。"""
         if not cover_path:
             return None
         p = Path(cover_path)
-        if not p.exists():
+        try:
+            src_mtime = os.stat(p).st_mtime_ns
+        except OSError:
             return None
         outp = self._thumb_path_for(p)
         try:
-            if outp.exists():
-                return outp
+            # 封面被替換（同檔名重新選擇/下載）時，舊縮圖要重建
+            try:
+                if os.stat(outp).st_mtime_ns >= src_mtime:
+                    return outp
+            except OSError:
+                pass
             size = int(self.config.get("thumb_size", 256))
-            img = QImage(str(p))
+            img = read_image_scaled(str(p), size, size)
             if img.isNull():
                 return None
             w, h = img.width(), img.height()
@@ -1284,19 +1856,76 @@ class LauncherApp(QMainWindow):
                 new_h = min(size, h)
                 new_w = int(w * (new_h / h))
             img2 = img.scaled(new_w, new_h, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            outp.parent.mkdir(parents=True, exist_ok=True)
-            img2.save(str(outp), "JPG", quality=85)
+            # 多個背景執行緒可能同時建立同一張縮圖，以暫存檔 + os.replace 寫入
+            if not save_image_atomic(img2, outp, "JPG", 85):
+                return None
             return outp
         except Exception:
             return None
 
 
+    # ---- 顯示尺寸縮圖的磁碟快取 ---- #
+    def _scaled_cache_file(self, src_path: Path, w: int, h: int, pin: bool, double: bool) -> Optional[Path]:
+        """以 sha1(路徑 + mtime + 尺寸 + pin) 命名快取檔；來源不存在回傳 None。"""
+        try:
+            mtime = os.stat(src_path).st_mtime_ns
+        except OSError:
+            return None
+        raw = f"{src_path}|{mtime}|{w}|{h}|{int(pin)}|{int(double)}".encode("utf-8")
+        return self.scaled_cache_path / f"{hashlib.sha1(raw).hexdigest()}.png"
+
+    def _schedule_prune_scaled_cache(self):
+        """磁碟快取的掃描/清理丟到背景執行緒，同一時間只跑一次。"""
+        if self._prune_future is None or self._prune_future.done():
+            self._prune_future = self._cover_executor.submit(self._prune_scaled_cache_job)
+
+    def _prune_scaled_cache_job(self):
+        try:
+            n, total = self._prune_scaled_cache()
+        except Exception:
+            n, total = 0, 0
+        self._thumb_signals.pruned.emit(n, total)
+
+    def _on_scaled_cache_pruned(self, n: int, total: int):
+        self._scaled_cache_count = n
+        self._scaled_cache_bytes = total
+
+    def _prune_scaled_cache(self) -> Tuple[int, int]:
+        """背景執行緒：超過檔數或容量上限時，先刪最久沒被使用（mtime）的快取檔，回傳剩餘 (檔數, 位元組數)。
+        一旦清理就刪到兩個上限的 90%，之後新存的縮圖不會每張都再觸發一次全目錄掃描。
+        atime 在 noatime/relatime 掛載下不可靠，因此命中時由 _load_thumb_job 更新 mtime。"""
+        limit = int(self.config.get("scaled_cache_max", 2000))
+        budget = int(self.config.get("scaled_cache_mb", 500)) << 20
+        try:
+            files = [(e, e.stat()) for e in os.scandir(self.scaled_cache_path)
+                     if e.is_file() and e.name.endswith(".png")]
+        except OSError:
+            return 0, 0
+        total = sum(st.st_size for _, st in files)
+        if len(files) <= limit and total <= budget:
+            return len(files), total
+        limit, budget = limit * 9 // 10, budget * 9 // 10
+        files.sort(key=lambda f: f[1].st_mtime_ns)
+        keep = len(files)
+        for e, st in files:
+            if keep <= limit and total <= budget:
+                break
+            try:
+                os.remove(e.path)
+            except OSError:
+                continue
+            keep -= 1
+            total -= st.st_size
+        return keep, total
+
     # ---- 縮圖/快取（無殘影、平滑） ---- #
     
-    def _get_thumb(self, cover_path: Optional[Path], grid: bool, double: bool=False, overlay_pin: bool=False) -> Optional[QPixmap]:
-        if not cover_path or not Path(cover_path).exists():
+    def _get_thumb(self, cover_path, grid: bool, double: bool=False, overlay_pin: bool=False) -> Optional[QPixmap]:
+        """取得縮放後的封面（cover_path 可為 Path 或字串）。
+        尚未快取則丟給背景執行緒，先回傳 None，完成後再重繪。"""
+        if not cover_path:
             return None
-        s = float(self.config.get("ui_scale", 1.0))
+        s = self._ui_scale
         if grid:
             w,h = int(160*s), int(140*s)
         else:
@@ -1304,40 +1933,145 @@ class LauncherApp(QMainWindow):
         if double:
             w*=2; h*=2
 
-        # 非 double（左側清單縮圖）優先使用縮圖；右欄放大圖使用原圖
-        src_path = Path(cover_path)
-        if not double:
-            thumbp = self._ensure_thumb_for(src_path)
-            if thumbp and Path(thumbp).exists():
-                src_path = Path(thumbp)
-
-        key = (str(src_path), w, h, bool(overlay_pin))
-        if key in self._thumb_cache:
-            return self._thumb_cache[key]
-        pm = QPixmap(str(src_path))
-        if pm.isNull(): 
-            return None
-        pm = pm.scaled(w, h, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        if overlay_pin:
-            pin_path = self._resolve_asset_path("assets/pin.png")
-            pin_pm = QPixmap(str(pin_path)) if pin_path.exists() else QPixmap()
-            if not pin_pm.isNull():
-                pin_size = max(12, int(min(pm.width(), pm.height()) * 0.26))
-                pin_pm = pin_pm.scaled(pin_size, pin_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                composed = QPixmap(pm.size())
-                composed.fill(Qt.transparent)
-                painter = QPainter(composed)
-                painter.setRenderHint(QPainter.SmoothPixmapTransform, True)
-                painter.drawPixmap(0, 0, pm)
-                margin = max(2, int(pin_size * 0.08))
-                x = pm.width() - pin_pm.width() - margin
-                y = pm.height() - pin_pm.height() - margin
-                painter.drawPixmap(x, y, pin_pm)
-                painter.end()
-                pm = composed
-        self._thumb_cache[key] = pm
+        # 記憶體快取命中時不轉 Path、不 stat；delegate 傳入的是 GameItem 預先算好的字串
+        skey = cover_path if isinstance(cover_path, str) else str(cover_path)
+        key = (skey, w, h, bool(overlay_pin), bool(double))
+        pm = QPixmapCache.find(self._thumb_cache_key(key))
+        if pm is not None:
+            return pm
+        if key in self._thumb_failed:
+            return self._no_cover_pixmap(w, h)
+        # GUI 執行緒只查記憶體快取；stat、讀磁碟快取與解碼都在背景
+        if key not in self._thumb_pending and key not in self._thumb_failed:
+            pin_src = self._pin_asset() if overlay_pin else ""
+            self._thumb_pending[key] = self._cover_executor.submit(
+                self._load_thumb_job, key, Path(skey), w, h, double, overlay_pin, pin_src)
+        return None
+
+    def _no_cover_pixmap(self, w: int, h: int) -> QPixmap:
+        """封面解碼失敗或檔案已不在時的佔位圖（外框 + No Cover），依尺寸快取。"""
+        key = f"nocover|{w}|{h}"
+        pm = QPixmapCache.find(key)
+        if pm is None:
+            pm = QPixmap(w, h)
+            pm.fill(Qt.transparent)
+            painter = QPainter(pm)
+            painter.setPen(self.palette().mid().color())
+            painter.drawRect(0, 0, w - 1, h - 1)
+            painter.drawText(pm.rect(), Qt.AlignCenter, "No Cover")
+            painter.end()
+            QPixmapCache.insert(key, pm)
         return pm
 
+    def _load_thumb_job(self, key, cover: Path, w: int, h: int, double: bool, pin: bool, pin_src: str):
+        """背景執行緒：先找磁碟上的顯示尺寸快取，沒有才解碼/縮放（_render_thumb_job）。"""
+        try:
+            disk = self._scaled_cache_file(cover, w, h, pin, double)
+        except Exception:
+            disk = None
+        if disk is None:   # 封面檔不存在
+            self._thumb_signals.ready.emit(key, None, 0)
+            return
+        if disk.exists():
+            img = QImage(str(disk))
+            if not img.isNull():
+                try:
+                    os.utime(disk)   # 標記為最近使用，清理時依 mtime 排序
+                except OSError:
+                    pass
+                self._thumb_signals.ready.emit(key, img, 0)
+                return
+        self._render_thumb_job(key, cover, w, h, double, pin_src, disk)
+
+    def _prefetch_thumbs(self, items: List[GameItem]):
+        """refresh 後先把清單前段的縮圖排進背景，捲到時多半已在快取。"""
+        n = int(self.config.get("thumb_prefetch", 120))
+        grid = self._view_mode == "grid"
+        for it in items[:n]:
+            if it.scover:
+                self._get_thumb(it.scover, grid=grid, overlay_pin=it.pinned)
+
+    def _render_thumb_job(self, key, cover: Path, w: int, h: int, double: bool, pin_src: str,
+                          disk: Optional[Path]):
+        """背景執行緒：解碼 + 縮放 + pin 疊圖（只用 QImage），存進磁碟快取後經 signal 交回。"""
+        img = None
+        saved = 0
+        try:
+            # 非 double（左側清單縮圖）優先使用縮圖；右欄放大圖使用預縮過的原圖
+            if double:
+                src = self._cover_base(cover)
+            else:
+                src = str(cover)
+                thumbp = self._ensure_thumb_for(cover)
+                if thumbp and Path(thumbp).exists():
+                    src = str(thumbp)
+            img = render_cover_image(src, w, h, pin_src)
+            if img.isNull():
+                img = None
+            elif disk and save_image_atomic(img, disk, "PNG"):
+                saved = disk.stat().st_size
+        except Exception:
+            img = None
+        self._thumb_signals.ready.emit(key, img, saved)
+
+    def _cover_base(self, cover: Path) -> QImage:
+        """右欄用的原圖：第一次載入時先縮到最大縮放所需尺寸並快取，之後各縮放倍率都從這張縮小。
+        多個背景執行緒會同時呼叫，快取存取需加鎖；鍵含 mtime，封面被替換後不會拿到舊圖。"""
+        try:
+            key = f"{cover}|{os.stat(cover).st_mtime_ns}"
+        except OSError:
+            return QImage()
+        with self._cover_base_lock:
+            if key in self._cover_base_cache:
+                return self._cover_base_cache[key]
+        img = read_image_scaled(str(cover), COVER_BASE_MAX[0], COVER_BASE_MAX[1])
+        if not img.isNull() and (img.width() > COVER_BASE_MAX[0] or img.height() > COVER_BASE_MAX[1]):
+            img = img.scaled(COVER_BASE_MAX[0], COVER_BASE_MAX[1], Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        with self._cover_base_lock:
+            self._cover_base_cache[key] = img
+        return img
+
+    def _on_thumb_ready(self, key, img, saved: int):
+        if self._thumb_pending.pop(key, None) is None:
+            return   # 排程後封面已被替換（_forget_cover），這是舊檔的結果
+        if img is None:
+            self._thumb_failed.add(key)   # 不再於每次重繪時重排同一個失敗的工作；改畫 No Cover 佔位圖
+        else:
+            QPixmapCache.insert(self._thumb_cache_key(key), QPixmap.fromImage(img))
+        if saved:
+            self._count_scaled_cache_file(saved)
+        if key[4]:
+            self._update_right_cover_size()
+        else:
+            self.view.viewport().update()
+
+    def _thumb_cache_key(self, key) -> str:
+        """(封面, w, h, pin, double) + 封面版本 -> QPixmapCache 用的字串鍵。"""
+        return "thumb|%s|%d|%d|%d|%d|%d" % (key + (self._cover_rev.get(key[0], 0),))
+
+    def _forget_cover(self, cover: Path):
+        """封面檔在同一路徑被替換：讓記憶體中的舊縮圖、失敗紀錄與排程中的工作全部失效。"""
+        skey = str(cover)
+        self._cover_rev[skey] = self._cover_rev.get(skey, 0) + 1
+        self._thumb_failed = {k for k in self._thumb_failed if k[0] != skey}
+        for key in [k for k in self._thumb_pending if k[0] == skey]:
+            self._thumb_pending.pop(key).cancel()
+        self._details_sig = None
+        self.view.viewport().update()
+
+    def _count_scaled_cache_file(self, size: int):
+        self._scaled_cache_count += 1
+        self._scaled_cache_bytes += size
+        if (self._scaled_cache_count > int(self.config.get("scaled_cache_max", 2000))
+                or self._scaled_cache_bytes > int(self.config.get("scaled_cache_mb", 500)) << 20):
+            self._schedule_prune_scaled_cache()
+
+    def _cancel_pending_thumbs(self):
+        """縮放/切換檢視後，舊尺寸的排程已無用，能取消的先取消。"""
+        for key, fut in list(self._thumb_pending.items()):
+            if fut.cancel():
+                self._thumb_pending.pop(key, None)
+
     # ---- 右鍵動作 ---- #
     def pick_rom_dir(self):
         init = self.config.get("last_dirs", {}).get("rom") or self.ed_rom.text() or os.getcwd()
@@ -1345,7 +2079,7 @@ class LauncherApp(QMainWindow):
         if not d: return
         self.config.setdefault("last_dirs", {})["rom"] = d
         self.ed_rom.setText(d); self.config["rom_dir"] = d; save_json(self.config_path, self.config)
-        self.refresh_rom_list()
+        self.reload_rom_list()
     
     def pick_melonds(self):
         init = self.config.get("last_dirs", {}).get("melonds") or (str(Path(self.ed_mel.text()).parent) if self.config.get("melonds_path") else os.getcwd())
@@ -1359,9 +2093,9 @@ class LauncherApp(QMainWindow):
         g = self._current_item()
         if not g:
             QMessageBox.information(self, APP_TITLE, tr(self, "tip_select")); return
-        self._pick_cover_for(g.path)
+        self._pick_cover_for(g.path, g.gid)
 
-    def _pick_cover_for(self, rom_path: Path):
+    def _pick_cover_for(self, rom_path: Path, gid: Optional[str] = None):
         init = self.config.get("last_dirs", {}).get("cover") or str(self.covers_path)
         fp, _ = QFileDialog.getOpenFileName(self, tr(self, "choose_cover"), init,
                                             "Images (*.png *.jpg *.jpeg);;All (*)")
@@ -1370,13 +2104,12 @@ class LauncherApp(QMainWindow):
         src = Path(fp); dst = self.covers_path / (rom_path.stem + src.suffix.lower())
         try:
             shutil.copyfile(src, dst)
-            # 立刻產生對應縮圖
-            try:
-                self._ensure_thumb_for(dst)
-            except Exception:
-                pass
-            gid = game_id_for(rom_path)
+            self._forget_cover(dst)
+            if gid is None:
+                gid = self._nds_info(rom_path)[2]
             self.covers_map[gid] = str(dst)
+            self._get_covers_resolved()[gid] = dst
+            self._covers_valid.clear()
             save_json(self.map_path, self.covers_map); save_json(self.config_path, self.config)
             self.refresh_rom_list()
         except Exception as e:
@@ -1386,20 +2119,22 @@ class LauncherApp(QMainWindow):
         g = self._current_item()
         if not g:
             QMessageBox.information(self, APP_TITLE, tr(self, "tip_select")); return
-        self._rename_title(g.path)
+        self._rename_title(g.path, g.gid)
 
     def keyPressEvent(self, event):
         if event.key() == Qt.Key_F2:
             g = self._current_item()
             if g:
-                self._rename_title(g.path)
+                self._rename_title(g.path, g.gid)
         else:
             super().keyPressEvent(event)
     
-    def _rename_title(self, rom_path: Path):
-        s = float(self.config.get("ui_scale", 1.0))
+    def _rename_title(self, rom_path: Path, gid: Optional[str] = None):
+        s = self._ui_scale
+        if gid is None:
+            gid = self._nds_info(rom_path)[2]
 
-        old = self._display_name_for(rom_path)
+        old = self._display_name_for(rom_path, gid)
 
         # 建立可調大小的對話框
         dlg = QInputDialog(self)
@@ -1418,25 +2153,25 @@ class LauncherApp(QMainWindow):
             new = dlg.textValue().strip()
             if not new:
                 return
-            gid = game_id_for(rom_path)
             self.titles_map[gid] = new
-            save_json(self.titles_path, self.titles_map)
-            self.refresh_rom_list()
+            self._titles_dirty = True
+            self._save_titles()
+            self._rebuild_items_from_cache()
 
     def pin_toggle_selected(self):
         g = self._current_item()
         if not g:
             QMessageBox.information(self, APP_TITLE, tr(self, "tip_select")); return
-        keep_path = str(g.path).replace("\\", "/")
-        files = set(self.config.get("pinned_files", []))
+        keep_path = g.spath
+        files = self._pin_set
         k = g.path.name
         if k in files:
             files.remove(k)
         else:
             files.add(k)
         self.config["pinned_files"] = sorted(files)
-        save_json(self.config_path, self.config)
-        self.refresh_rom_list()
+        self._schedule_save_config()
+        self._rebuild_items_from_cache()
         self._select_path(keep_path)
 
     def launch_selected(self):
@@ -1474,31 +2209,57 @@ class LauncherApp(QMainWindow):
 class TitleSearchSortProxy(QSortFilterProxyModel):
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._last_filter: Optional[str] = None
+        self._needle = ""
+        self._rx: Optional[QRegularExpression] = None
+        self._rx_ok = True
+        self._narrow_from: Optional[set] = None
+        self._accepted: set = set()
+        # 來源清單在 _scan_roms 已依「釘選優先、標題」排好；proxy 只負責過濾，不做排序
         self.setDynamicSortFilter(True)
-        self.setFilterCaseSensitivity(Qt.CaseInsensitive)
-        self.setSortCaseSensitivity(Qt.CaseInsensitive)
+
+    def setSourceModel(self, model):
+        # 來源重建或資料變動後，上一輪的符合列已失效；須在 proxy 內部重新過濾之前先接上
+        model.modelReset.connect(self._reset_narrowing)
+        model.dataChanged.connect(self._reset_narrowing)
+        super().setSourceModel(model)
+
+    def _reset_narrowing(self, *args):
+        self._last_filter = None
+        self._narrow_from = None
 
     def setFilterString(self, s: str):
-        self.setFilterRegularExpression(QRegularExpression(s))
+        # 「re:」開頭才當正規表示式（只編譯這一次）；其餘做不分大小寫的子字串比對
+        if s.startswith("re:"):
+            pat = s[3:]
+            self._rx = QRegularExpression(pat, QRegularExpression.CaseInsensitiveOption) if pat else None
+            self._rx_ok = self._rx is None or self._rx.isValid()   # 打到一半的不合法樣式：全部不符合
+            self._needle = ""
+            self._narrow_from = None
+            self._last_filter = None
+        else:
+            needle = s.casefold()
+            # 是上一次關鍵字的延伸時，結果必為上一輪的子集，只需重驗上一輪符合的列
+            last = self._last_filter
+            self._narrow_from = self._accepted if last is not None and needle.startswith(last) else None
+            self._rx = None
+            self._needle = needle
+            self._last_filter = needle
+        self._accepted = set()
+        self.invalidateFilter()
 
     def filterAcceptsRow(self, src_row, src_parent):
-        idx = self.sourceModel().index(src_row, 0, src_parent)
-        title = self.sourceModel().data(idx, Roles.Title) or ""
-        # 同時容許以檔名輔助
-        path = self.sourceModel().data(idx, Roles.Path) or ""
-        re = self.filterRegularExpression()
-        if not re.pattern():
-            return True
-        return re.match(str(title)).hasMatch() or re.match(str(path)).hasMatch()
-
-    def lessThan(self, left, right):
-        lpin = bool(self.sourceModel().data(left, Roles.Pinned))
-        rpin = bool(self.sourceModel().data(right, Roles.Pinned))
-        if lpin != rpin:
-            return lpin  # pinned 優先
-        lt = str(self.sourceModel().data(left, Roles.Title) or "")
-        rt = str(self.sourceModel().data(right, Roles.Title) or "")
-        return lt.lower() < rt.lower()
+        if self._narrow_from is not None and src_row not in self._narrow_from:
+            return False
+        g = self.sourceModel().item(src_row)
+        # 同時容許以檔名（路徑）輔助
+        if self._rx is not None:
+            if not self._rx_ok or not (self._rx.match(g.title).hasMatch() or self._rx.match(g.spath).hasMatch()):
+                return False
+        elif self._needle and self._needle not in g.search_cf:
+            return False
+        self._accepted.add(src_row)
+        return True
 
 # ---- Delegate：統一繪製 Grid/List 卡片 ---- #
 
@@ -1506,6 +2267,43 @@ class CardDelegate(QStyledItemDelegate):
     def __init__(self, app: LauncherApp):
         super().__init__(app)
         self.app = app
+        self._fonts: Optional[Dict[str, Any]] = None
+        self._geom: Optional[Dict[str, Any]] = None
+
+    def _geom_ctx(self) -> Dict[str, Any]:
+        """依縮放倍率與檢視模式算好的尺寸（縮圖框、標題高、行距、sizeHint）；兩者之一改變才重算。"""
+        s = self.app._ui_scale
+        key = (s, self.app._view_mode)
+        if self._geom is None or self._geom["key"] != key:
+            is_grid = key[1] == "grid"
+            self._geom = {
+                "key": key, "s": s, "grid": is_grid,
+                "thumb_w": int(148*s), "thumb_h": int(140*s) if is_grid else int(112*s),
+                "title_h": int(40*s), "gap": int(6*s),
+                "size": QSize(int(180*s), int(200*s)) if is_grid else QSize(int(420*s), int(140*s)),
+            }
+        return self._geom
+
+    def _font_ctx(self, base: QFont, s: float) -> Dict[str, Any]:
+        """標題/路徑字型與 metrics 只在縮放或基礎字型改變時重建，不在每次 paint 重算。"""
+        key = (s, base.key())
+        if self._fonts is None or self._fonts["key"] != key:
+            f = QFont(base)
+            f.setBold(True)
+            f.setPointSize(int(f.pointSize() * s * 1.2))
+            # List 模式：標題再放大、路徑改非粗體且較小
+            f_title = QFont(f)
+            f_title.setPointSize(f_title.pointSize() + 10)
+            f_path = QFont(f_title)
+            f_path.setBold(False)
+            f_path.setPointSize(f_title.pointSize() - 6)
+            self._fonts = {
+                "key": key,
+                "grid": f, "grid_fm": QFontMetrics(f),
+                "title": f_title, "title_h": QFontMetrics(f_title).height(),
+                "path": f_path, "path_h": QFontMetrics(f_path).height(),
+            }
+        return self._fonts
 
     def paint(self, painter: QPainter, option, index):
         painter.save()
@@ -1515,10 +2313,11 @@ class CardDelegate(QStyledItemDelegate):
         disp_title_list = self.app._fmt_title_list(gtitle)
         pinned = bool(index.data(Roles.Pinned))
         cover = index.data(Roles.Cover) or ""
-        path = Path(index.data(Roles.Path))
+        spath = index.data(Roles.Path) or ""
 
-        is_grid = self.app._view_mode == "grid"
-        pm = self.app._get_thumb(Path(cover) if cover else None, grid=is_grid, double=False, overlay_pin=pinned)
+        geom = self._geom_ctx()
+        is_grid = geom["grid"]
+        pm = self.app._get_thumb(cover, grid=is_grid, double=False, overlay_pin=pinned)
 
         # 背景與選中高亮
         if option.state & QStyle.State_Selected:
@@ -1529,12 +2328,12 @@ class CardDelegate(QStyledItemDelegate):
         painter.drawRoundedRect(r, 8, 8)
 
         # 縮圖
-        s = float(self.app.config.get("ui_scale", 1.0))
+        s = geom["s"]
         if is_grid:
-            thumb_rect = QRect(r.left()+10, r.top()+10, r.width()-20, int(140*s))
+            thumb_rect = QRect(r.left()+10, r.top()+10, r.width()-20, geom["thumb_h"])
         else:
-            th = int(112*s)
-            tw = int(148*s)
+            th = geom["thumb_h"]
+            tw = geom["thumb_w"]
             thumb_rect = QRect(r.left()+10, r.top() + (r.height()-th)//2, tw, th)
 
         if pm:
@@ -1544,20 +2343,20 @@ class CardDelegate(QStyledItemDelegate):
         else:
             painter.setPen(option.palette.mid().color())
             painter.drawRect(thumb_rect)
-            painter.drawText(thumb_rect, Qt.AlignCenter, "No Cover")
+            if not cover:
+                # 有封面但仍在背景載入時只畫外框
+                painter.drawText(thumb_rect, Qt.AlignCenter, "No Cover")
 
         # Title/path
-        f = painter.font()
-        f.setBold(True)
-        f.setPointSize(int(f.pointSize() * s * 1.2))
-        painter.setFont(f)
+        fonts = self._font_ctx(painter.font(), s)
+        painter.setFont(fonts["grid"])
         painter.setPen(option.palette.text().color())
 
         if is_grid:
-            title_rect = QRect(r.left()+10, thumb_rect.bottom()+8, r.width()-20, int(40*s))
+            title_rect = QRect(r.left()+10, thumb_rect.bottom()+8, r.width()-20, geom["title_h"])
 
             # 使用 QFontMetrics 限制兩行，超出加省略號
-            fm = QFontMetrics(f)
+            fm = fonts["grid_fm"]
             line_height = fm.lineSpacing()
             max_height = line_height * 2
             max_rect = QRect(title_rect.left(), title_rect.top(), title_rect.width(), max_height)
@@ -1571,22 +2370,11 @@ class CardDelegate(QStyledItemDelegate):
             text_x = thumb_rect.right() + 12
             text_w = r.width() - thumb_rect.width() - 22
 
-            # 1) 標題字型：沿用前面設定（粗體、倍率）
-            f_title = QFont(painter.font())
-            f_title.setBold(True)
-            f_title.setPointSize(f_title.pointSize() + 10)
-            painter.setFont(f_title)
-            fm_title = QFontMetrics(f_title)
-            title_h = fm_title.height()
+            # 1) 標題字型（粗體、倍率 +10）；2) 路徑字型（非粗體、較小）— 見 _font_ctx
+            f_title, title_h = fonts["title"], fonts["title_h"]
+            f_path, path_h = fonts["path"], fonts["path_h"]
 
-            # 2) 路徑字型：非粗體（若要更小，可自行 setPointSize(f_title.pointSize()-6)）
-            f_path = QFont(painter.font())
-            f_path.setBold(False)
-            f_path.setPointSize(f_title.pointSize() - 6)  # 需要更小字時可開啟
-            fm_path = QFontMetrics(f_path)
-            path_h = fm_path.height()
-
-            gap = int(6 * s)  # 行距
+            gap = geom["gap"]  # 行距
             total_h = title_h + gap + path_h
             y0 = r.y() + (r.height() - total_h) // 2
 
@@ -1601,27 +2389,16 @@ class CardDelegate(QStyledItemDelegate):
             # 畫路徑
             painter.setFont(f_path)
             painter.setPen(QColor(100, 100, 100))
-            painter.drawText(path_rect, Qt.AlignLeft | Qt.AlignVCenter, str(path).replace("\\", "/"))
+            painter.drawText(path_rect, Qt.AlignLeft | Qt.AlignVCenter, spath)
 
         # pin 標記由覆蓋的 pin.png 顯示於縮圖右下角（見 _get_thumb）
 
         painter.restore()
 
     def sizeHint(self, option, index):
-        s = float(self.app.config.get("ui_scale", 1.0))
-        if self.app._view_mode == "grid":
-            return QSize(int(180*s), int(200*s))
-        else:
-            return QSize(int(420*s), int(140*s))
+        return self._geom_ctx()["size"]
         
 # ---- 進入點 ---- #
-    def _grid_base_wh(self) -> Tuple[int, int]:
-        """取得目前檢視模式對應的縮圖基準寬高（尚未 *2）。"""
-        s = float(self.config.get("ui_scale", 1.0))
-        if self._view_mode == "grid":
-            return int(160*s), int(140*s)
-        else:
-            return int(148*s), int(112*s)
 
 def main():
     # 正確設定 Windows 的 High DPI 策略（Enum 不能被呼叫，直接取成員）